@@ -5,257 +5,533 @@ A Model Context Protocol server for GitHub operations including creating repos a
 """
 
 import asyncio
-import json
+import functools
 import sys
 import os
+import stat
 import subprocess
-from typing import Any, Dict, List, Optional
-from github import Github
-import requests
+import time
+import weakref
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import httpx
+import orjson
+import pygit2
+from cachetools import LRUCache, TTLCache
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-class GitHubMCPServer:
-    def __init__(self):
-        # Initialize GitHub client - will use token from environment or gh CLI
-        self.github_token = self._get_github_token()
-        self.github_client = Github(self.github_token) if self.github_token else None
-        
-        self.tools = {
-            "create_repo": {
-                "name": "create_repo",
-                "description": "Create a new GitHub repository",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Repository name"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Repository description (optional)"
-                        },
-                        "private": {
-                            "type": "boolean",
-                            "description": "Whether the repository should be private (default: false)"
-                        },
-                        "initialize": {
-                            "type": "boolean",
-                            "description": "Initialize with README (default: true)"
-                        }
-                    },
-                    "required": ["name"]
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Retries for GitHub API calls rejected by a rate limit
+RATE_LIMIT_RETRIES = 3
+
+# How long get_repo_info results are reused, in seconds
+REPO_INFO_TTL = 60
+
+# Repositories whose validation and libgit2 handle are kept
+REPO_CACHE_SIZE = 256
+
+# Maximum number of requests handled concurrently
+MAX_INFLIGHT_REQUESTS = 64
+# Most responses coalesced into a single stdout write
+WRITE_BATCH_SIZE = 64
+# Bytes requested from stdin per read
+STDIN_READ_SIZE = 64 * 1024
+# Longest JSON-RPC message accepted on stdin
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+
+# Tool schemas advertised through tools/list. Only the top-level mapping is
+# read-only; don't modify the schemas after import, since TOOLS_LIST_RESULT
+# below is serialized from them once
+TOOLS = MappingProxyType({
+    "create_repo": {
+        "name": "create_repo",
+        "description": "Create a new GitHub repository",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Repository name"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Repository description (optional)"
+                },
+                "private": {
+                    "type": "boolean",
+                    "description": "Whether the repository should be private (default: false)"
+                },
+                "initialize": {
+                    "type": "boolean",
+                    "description": "Initialize with README (default: true)"
                 }
             },
-            "commit_and_push": {
-                "name": "commit_and_push",
-                "description": "Commit changes and push to GitHub repository",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "repo_path": {
-                            "type": "string",
-                            "description": "Local repository path"
-                        },
-                        "commit_message": {
-                            "type": "string",
-                            "description": "Commit message"
-                        },
-                        "files": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Specific files to commit (optional, commits all changes if not specified)"
-                        },
-                        "branch": {
-                            "type": "string",
-                            "description": "Branch to push to (default: current branch)"
-                        }
-                    },
-                    "required": ["repo_path", "commit_message"]
+            "required": ["name"]
+        }
+    },
+    "commit_and_push": {
+        "name": "commit_and_push",
+        "description": "Commit changes and push to GitHub repository",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "repo_path": {
+                    "type": "string",
+                    "description": "Local repository path"
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message"
+                },
+                "files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific files to commit (optional, commits all changes if not specified)"
+                },
+                "branch": {
+                    "type": "string",
+                    "description": "Branch to push to (default: current branch)"
+                },
+                "no_verify": {
+                    "type": "boolean",
+                    "description": "Skip pre-commit and pre-push hooks (default: false)"
                 }
             },
-            "clone_repo": {
-                "name": "clone_repo",
-                "description": "Clone a GitHub repository",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "repo_url": {
-                            "type": "string",
-                            "description": "GitHub repository URL or owner/repo format"
-                        },
-                        "destination": {
-                            "type": "string",
-                            "description": "Local destination path (optional)"
-                        },
-                        "branch": {
-                            "type": "string",
-                            "description": "Specific branch to clone (optional)"
-                        }
-                    },
-                    "required": ["repo_url"]
+            "required": ["repo_path", "commit_message"]
+        }
+    },
+    "clone_repo": {
+        "name": "clone_repo",
+        "description": "Clone a GitHub repository",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "repo_url": {
+                    "type": "string",
+                    "description": "GitHub repository URL or owner/repo format"
+                },
+                "destination": {
+                    "type": "string",
+                    "description": "Local destination path (optional)"
+                },
+                "branch": {
+                    "type": "string",
+                    "description": "Specific branch to clone (optional)"
+                },
+                "depth": {
+                    "type": "integer",
+                    "description": "Number of commits of history to fetch; a shallow clone contains only one branch (default: 1, 0 for all)"
+                },
+                "filter": {
+                    "type": "string",
+                    "description": "Partial clone filter spec (default: blob:none, file contents fetched on demand)"
+                },
+                "full_history": {
+                    "type": "boolean",
+                    "description": "Clone all history and objects, ignoring depth and filter (default: false)"
                 }
             },
-            "create_issue": {
-                "name": "create_issue",
-                "description": "Create a new issue in a GitHub repository",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "repo": {
-                            "type": "string",
-                            "description": "Repository in owner/repo format"
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Issue title"
-                        },
-                        "body": {
-                            "type": "string",
-                            "description": "Issue description (optional)"
-                        },
-                        "labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Issue labels (optional)"
-                        }
-                    },
-                    "required": ["repo", "title"]
+            "required": ["repo_url"]
+        }
+    },
+    "create_issue": {
+        "name": "create_issue",
+        "description": "Create a new issue in a GitHub repository",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "repo": {
+                    "type": "string",
+                    "description": "Repository in owner/repo format"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Issue title"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Issue description (optional)"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Issue labels (optional)"
                 }
             },
-            "list_repos": {
-                "name": "list_repos",
-                "description": "List GitHub repositories for the authenticated user",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "type": {
-                            "type": "string",
-                            "enum": ["all", "owner", "public", "private"],
-                            "description": "Type of repositories to list (default: all)"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of repositories to return (default: 10)"
-                        }
-                    }
+            "required": ["repo", "title"]
+        }
+    },
+    "list_repos": {
+        "name": "list_repos",
+        "description": "List GitHub repositories for the authenticated user",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type": {
+                    "type": "string",
+                    "enum": ["all", "owner", "public", "private"],
+                    "description": "Type of repositories to list (default: all)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of repositories to return (default: 10)"
                 }
-            },
-            "get_repo_info": {
-                "name": "get_repo_info",
-                "description": "Get information about a specific GitHub repository",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "repo": {
-                            "type": "string",
-                            "description": "Repository in owner/repo format"
-                        }
-                    },
-                    "required": ["repo"]
+            }
+        }
+    },
+    "get_repo_info": {
+        "name": "get_repo_info",
+        "description": "Get information about a specific GitHub repository",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "repo": {
+                    "type": "string",
+                    "description": "Repository in owner/repo format"
                 }
+            },
+            "required": ["repo"]
+        }
+    }
+})
+
+# tools/list never changes, so serialize it once and embed the bytes as-is
+TOOLS_LIST_RESULT = orjson.Fragment(orjson.dumps({"tools": list(TOOLS.values())}))
+
+
+# Cached so `gh auth token` is only spawned once per process;
+# call _get_github_token.cache_clear() after re-authenticating
+@functools.lru_cache(maxsize=1)
+def _get_github_token() -> Optional[str]:
+    """Get GitHub token from environment or gh CLI"""
+    # Try environment variable first
+    token = os.getenv('GITHUB_TOKEN')
+    if token:
+        return token
+    
+    # Try to get token from gh CLI
+    try:
+        result = subprocess.run(['gh', 'auth', 'token'], 
+                              capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+class GitHubRateLimiter:
+    """Shared gate for GitHub API calls driven by GitHub's rate-limit headers"""
+
+    MAX_BACKOFF = 32
+    # Longer waits fail the call instead of stalling the tool
+    MAX_WAIT = 60
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._remaining = None
+        self._reset_at = 0.0
+        self._blocked_until = 0.0
+        self._backoff = 1
+
+    def _wait_time(self) -> float:
+        now = time.time()
+        wait = self._blocked_until - now
+        if self._remaining == 0:
+            wait = max(wait, self._reset_at - now)
+        return wait
+
+    async def acquire(self):
+        """Wait until GitHub is expected to accept another request"""
+        async with self._condition:
+            while True:
+                wait = self._wait_time()
+                if wait <= 0:
+                    break
+                if wait > self.MAX_WAIT:
+                    reset = time.strftime('%H:%M:%S', time.localtime(time.time() + wait))
+                    raise RuntimeError(f"GitHub rate limit exceeded, resets at {reset}")
+                try:
+                    await asyncio.wait_for(self._condition.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            
+            if self._remaining:
+                self._remaining -= 1
+
+    async def update(self, response: httpx.Response) -> bool:
+        """Record rate-limit state from a response, returning True if it was rate limited"""
+        headers = response.headers
+        async with self._condition:
+            if "x-ratelimit-remaining" in headers:
+                self._remaining = int(headers["x-ratelimit-remaining"])
+                self._reset_at = float(headers.get("x-ratelimit-reset", 0))
+            
+            limited = response.status_code == 429 or (response.status_code == 403 and (
+                "retry-after" in headers
+                or headers.get("x-ratelimit-remaining") == "0"
+                or "rate limit" in response.text.lower()
+            ))
+            
+            if limited:
+                if "retry-after" in headers:
+                    delay = float(headers["retry-after"])
+                elif headers.get("x-ratelimit-remaining") == "0":
+                    # acquire() already waits for the reset time
+                    delay = 0
+                else:
+                    delay = self._backoff
+                    self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+                self._blocked_until = max(self._blocked_until, time.time() + delay)
+            else:
+                self._backoff = 1
+            
+            self._condition.notify_all()
+        return limited
+
+
+class GitHubMCPServer:
+    _INFO_TMPL = (
+        "📁 Repository: {full_name}\n"
+        "📝 Description: {description}\n"
+        "🌍 Visibility: {visibility}\n"
+        "⭐ Stars: {stargazers_count}\n"
+        "🍴 Forks: {forks_count}\n"
+        "📊 Language: {language}\n"
+        "🔗 URL: {html_url}\n"
+        "📅 Created: {created}\n"
+        "📅 Updated: {updated}\n"
+        "📏 Size: {size} KB"
+    )
+
+    def __init__(self):
+        # Initialize GitHub client - will use token from environment or gh CLI
+        self.github_token = _get_github_token()
+        self._http = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            headers={
+                "Authorization": f"Bearer {self.github_token}",
+                "Accept": "application/vnd.github+json"
             }
+        ) if self.github_token else None
+        self._rate_limiter = GitHubRateLimiter()
+        self._repo_info_cache = TTLCache(maxsize=1024, ttl=REPO_INFO_TTL)
+        self._pending_calls = {}
+        
+        # libgit2 handles are reused across commit_and_push calls
+        self._repos = LRUCache(maxsize=REPO_CACHE_SIZE)
+        self._known_repos = LRUCache(maxsize=REPO_CACHE_SIZE)
+        # Locks disappear once no call is using them
+        self._repo_locks = weakref.WeakValueDictionary()
+        
+        self._out_q = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+        
+        self.tools = TOOLS
+        
+        self._tool_handlers = {
+            "create_repo": self.create_repo,
+            "commit_and_push": self.commit_and_push,
+            "clone_repo": self.clone_repo,
+            "create_issue": self.create_issue,
+            "list_repos": self.list_repos,
+            "get_repo_info": self.get_repo_info
         }
 
-    def _get_github_token(self) -> Optional[str]:
-        """Get GitHub token from environment or gh CLI"""
-        # Try environment variable first
-        token = os.getenv('GITHUB_TOKEN')
-        if token:
-            return token
+    async def close(self):
+        """Release the GitHub HTTP connection pool"""
+        if self._http:
+            await self._http.aclose()
+
+    async def _github_request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a GitHub REST API request, raising on error responses"""
+        for _ in range(RATE_LIMIT_RETRIES + 1):
+            await self._rate_limiter.acquire()
+            response = await self._http.request(method, path, **kwargs)
+            if not await self._rate_limiter.update(response):
+                break
         
-        # Try to get token from gh CLI
-        try:
-            result = subprocess.run(['gh', 'auth', 'token'], 
-                                  capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
+        if response.is_error:
+            try:
+                message = response.json().get("message")
+            except ValueError:
+                message = None
+            raise RuntimeError(f"{response.status_code} {message or response.reason_phrase}")
+        return response
 
-    def _run_git_command(self, command: List[str], cwd: str = None) -> Dict[str, Any]:
+    async def _run_git_command(self, command: List[str], cwd: str = None) -> Dict[str, Any]:
         """Run a git command and return the result"""
-        try:
-            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, check=True)
+        proc = await asyncio.create_subprocess_exec(
+            *command, cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        
+        # Output stays as bytes; it is only decoded for error messages
+        if proc.returncode == 0:
             return {
                 "success": True,
-                "stdout": result.stdout.strip(),
-                "stderr": result.stderr.strip()
-            }
-        except subprocess.CalledProcessError as e:
-            return {
-                "success": False,
-                "error": f"Command failed: {' '.join(command)}",
-                "stdout": e.stdout,
-                "stderr": e.stderr,
-                "return_code": e.returncode
+                "stdout_b": stdout,
+                "stderr_b": stderr
             }
+        return {
+            "success": False,
+            "error": f"Command failed: {' '.join(command)}",
+            "stdout_b": stdout,
+            "stderr_b": stderr,
+            "stdout": stdout.decode(errors='replace'),
+            "stderr": stderr.decode(errors='replace'),
+            "return_code": proc.returncode
+        }
+
+    def _is_git_repo(self, repo_path: str) -> bool:
+        """Check for a .git directory or gitlink file, remembering repositories already seen"""
+        # Only positive results are kept, so a path that later becomes a repo is picked up
+        if self._known_repos.get(repo_path):
+            return True
+        
+        git_path = os.path.join(repo_path, '.git')
+        if os.path.isdir(git_path) or os.path.isfile(git_path):
+            self._known_repos[repo_path] = True
+            return True
+        return False
+
+    def _has_changes(self, repo: pygit2.Repository, repo_path: str, files: Optional[List[str]]) -> bool:
+        """Check in-process with libgit2 whether there is anything to commit"""
+        # libgit2 wants paths relative to the repository root
+        paths = [
+            os.path.relpath(os.path.join(repo_path, file), repo_path).replace(os.sep, '/')
+            for file in files or []
+        ]
+        if not paths or '.' in paths:
+            return bool(repo.status(untracked_files='normal'))
+        
+        for path in paths:
+            try:
+                flags = repo.status_file(path)
+            except (KeyError, ValueError, pygit2.GitError):
+                # Directories, globs and unknown paths are left for git add to resolve
+                return True
+            if flags not in (pygit2.GIT_STATUS_CURRENT, pygit2.GIT_STATUS_IGNORED):
+                return True
+
+        # git commit also picks up anything staged earlier, even outside the listed paths
+        index = repo.index
+        index.read()
+        if repo.head_is_unborn:
+            return len(index) > 0
+        return len(index.diff_to_tree(repo.head.peel(pygit2.Tree))) > 0
 
     async def create_repo(self, name: str, description: str = "", private: bool = False, initialize: bool = True) -> str:
         """Create a new GitHub repository"""
-        if not self.github_client:
+        if not self._http:
             return "❌ GitHub authentication required. Set GITHUB_TOKEN environment variable or use 'gh auth login'"
         
         try:
-            user = self.github_client.get_user()
-            repo = user.create_repo(
-                name=name,
-                description=description,
-                private=private,
-                auto_init=initialize
-            )
+            response = await self._github_request("POST", "/user/repos", json={
+                "name": name,
+                "description": description,
+                "private": private,
+                "auto_init": initialize
+            })
+            repo = response.json()
             
-            return f"✅ Repository created successfully!\n🔗 URL: {repo.html_url}\n📝 Clone: git clone {repo.clone_url}"
+            return f"✅ Repository created successfully!\n🔗 URL: {repo['html_url']}\n📝 Clone: git clone {repo['clone_url']}"
         
         except Exception as e:
             return f"❌ Failed to create repository: {str(e)}"
 
-    async def commit_and_push(self, repo_path: str, commit_message: str, files: List[str] = None, branch: str = None) -> str:
+    async def commit_and_push(self, repo_path: str, commit_message: str, files: List[str] = None, branch: str = None, no_verify: bool = False) -> str:
         """Commit changes and push to GitHub"""
-        if not os.path.exists(repo_path):
-            return f"❌ Repository path does not exist: {repo_path}"
-        
-        if not os.path.exists(os.path.join(repo_path, '.git')):
+        # Caches are keyed by the resolved path so every spelling of it matches
+        repo_root = os.path.realpath(repo_path)
+        if not self._is_git_repo(repo_root):
+            if not os.path.exists(repo_path):
+                return f"❌ Repository path does not exist: {repo_path}"
             return f"❌ Not a git repository: {repo_path}"
         
-        results = []
-        
-        # Add files
-        if files:
-            for file in files:
-                result = self._run_git_command(['git', 'add', file], cwd=repo_path)
+        # Git operations on one repository must not interleave
+        lock = self._repo_locks.get(repo_root)
+        if lock is None:
+            lock = self._repo_locks[repo_root] = asyncio.Lock()
+        async with lock:
+            results = []
+            
+            # Skip add, commit and push when nothing changed. The handle cache isn't
+            # thread-safe, so it is only used here and the worker gets just the handle.
+            try:
+                repo = self._repos.get(repo_root)
+                if repo is None:
+                    repo = self._repos[repo_root] = pygit2.Repository(repo_root)
+                changed = await asyncio.get_event_loop().run_in_executor(
+                    None, self._has_changes, repo, repo_root, files
+                )
+            except pygit2.GitError as e:
+                self._repos.pop(repo_root, None)
+                return f"❌ Failed to check status: {e}"
+            
+            if not changed:
+                return "ℹ️ No changes to commit"
+            
+            # Add files through git itself so clean filters (e.g. Git LFS) apply
+            if files:
+                result = await self._run_git_command(['git', 'add', '--', *files], cwd=repo_path)
                 if not result['success']:
-                    return f"❌ Failed to add file {file}: {result['stderr']}"
-        else:
-            result = self._run_git_command(['git', 'add', '.'], cwd=repo_path)
+                    return f"❌ Failed to add files {', '.join(files)}: {result['stderr']}"
+            else:
+                result = await self._run_git_command(['git', 'add', '.'], cwd=repo_path)
+                if not result['success']:
+                    return f"❌ Failed to add files: {result['stderr']}"
+            
+            # Commit
+            commit_cmd = ['git', 'commit', '-m', commit_message]
+            if no_verify:
+                commit_cmd.append('--no-verify')
+            
+            result = await self._run_git_command(commit_cmd, cwd=repo_path)
             if not result['success']:
-                return f"❌ Failed to add files: {result['stderr']}"
-        
-        # Commit
-        result = self._run_git_command(['git', 'commit', '-m', commit_message], cwd=repo_path)
-        if not result['success']:
-            if "nothing to commit" in result['stdout']:
-                return "ℹ️ No changes to commit"
-            return f"❌ Failed to commit: {result['stderr']}"
-        
-        results.append(f"✅ Committed: {commit_message}")
-        
-        # Push
-        push_cmd = ['git', 'push']
-        if branch:
-            push_cmd.extend(['origin', branch])
-        
-        result = self._run_git_command(push_cmd, cwd=repo_path)
-        if not result['success']:
-            return f"❌ Failed to push: {result['stderr']}"
-        
-        results.append("✅ Pushed to GitHub successfully")
-        
-        return "\n".join(results)
+                if b"nothing to commit" in result['stdout_b']:
+                    return "ℹ️ No changes to commit"
+                return f"❌ Failed to commit: {result['stderr']}"
+            
+            results.append(f"✅ Committed: {commit_message}")
+            
+            # Push
+            push_cmd = ['git', 'push', '--atomic']
+            if no_verify:
+                push_cmd.append('--no-verify')
+            if branch:
+                push_cmd.extend(['origin', branch])
+            
+            result = await self._run_git_command(push_cmd, cwd=repo_path)
+            if not result['success']:
+                return f"❌ Failed to push: {result['stderr']}"
+            
+            results.append("✅ Pushed to GitHub successfully")
+            
+            return "\n".join(results)
 
-    async def clone_repo(self, repo_url: str, destination: str = None, branch: str = None) -> str:
+    async def clone_repo(self, repo_url: str, destination: str = None, branch: str = None,
+                         depth: int = 1, filter: str = "blob:none", full_history: bool = False) -> str:
         """Clone a GitHub repository"""
         clone_cmd = ['git', 'clone']
         
+        # Shallow, blobless clones move far less data; full_history opts out
+        if not full_history:
+            if depth:
+                # --depth implies this already; kept explicit since it limits the clone to one branch
+                clone_cmd.extend([f'--depth={depth}', '--single-branch'])
+            if filter:
+                clone_cmd.append(f'--filter={filter}')
+        
         if branch:
             clone_cmd.extend(['-b', branch])
         
@@ -264,75 +540,109 @@ class GitHubMCPServer:
         if destination:
             clone_cmd.append(destination)
         
-        result = self._run_git_command(clone_cmd)
+        result = await self._run_git_command(clone_cmd)
         
         if result['success']:
-            return f"✅ Repository cloned successfully\n📁 Location: {destination or repo_url.split('/')[-1].replace('.git', '')}"
+            location = destination or repo_url.split('/')[-1].replace('.git', '')
+            # A fresh clone may replace a repository seen earlier at the same path
+            repo_root = os.path.realpath(location)
+            self._known_repos.pop(repo_root, None)
+            self._repos.pop(repo_root, None)
+            return f"✅ Repository cloned successfully\n📁 Location: {location}"
         else:
             return f"❌ Failed to clone repository: {result['stderr']}"
 
     async def create_issue(self, repo: str, title: str, body: str = "", labels: List[str] = None) -> str:
         """Create a new issue in a GitHub repository"""
-        if not self.github_client:
+        if not self._http:
             return "❌ GitHub authentication required"
         
         try:
-            repository = self.github_client.get_repo(repo)
-            issue = repository.create_issue(
-                title=title,
-                body=body,
-                labels=labels or []
-            )
+            response = await self._github_request("POST", f"/repos/{repo}/issues", json={
+                "title": title,
+                "body": body,
+                "labels": labels or []
+            })
+            issue = response.json()
             
-            return f"✅ Issue created successfully!\n🔗 URL: {issue.html_url}\n#️⃣ Number: #{issue.number}"
+            return f"✅ Issue created successfully!\n🔗 URL: {issue['html_url']}\n#️⃣ Number: #{issue['number']}"
         
         except Exception as e:
             return f"❌ Failed to create issue: {str(e)}"
 
+    async def _single_flight(self, key: tuple, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Share one in-flight call among concurrent callers with the same key"""
+        task = self._pending_calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending_calls[key] = task
+            task.add_done_callback(lambda _: self._pending_calls.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
     async def list_repos(self, repo_type: str = "all", limit: int = 10) -> str:
         """List GitHub repositories"""
-        if not self.github_client:
+        if not self._http:
             return "❌ GitHub authentication required"
         
+        return await self._single_flight(("repos", repo_type, limit),
+                                         lambda: self._fetch_repo_list(repo_type, limit))
+
+    async def _fetch_repo_list(self, repo_type: str, limit: int) -> str:
+        """Fetch and format the repository list from GitHub"""
         try:
-            user = self.github_client.get_user()
-            repos = user.get_repos(type=repo_type)
+            # Ask for no more than needed so small limits take a single small page
+            repos = []
+            url, params = "/user/repos", {"type": repo_type, "per_page": min(limit, 100)}
+            while url and len(repos) < limit:
+                response = await self._github_request("GET", url, params=params)
+                repos.extend(response.json())
+                url, params = response.links.get("next", {}).get("url"), None
             
             repo_list = []
-            for i, repo in enumerate(repos):
-                if i >= limit:
-                    break
-                
-                visibility = "🔒 Private" if repo.private else "🌍 Public"
-                repo_list.append(f"📁 {repo.name} - {visibility}\n   🔗 {repo.html_url}\n   📝 {repo.description or 'No description'}")
+            for repo in repos[:limit]:
+                visibility = "🔒 Private" if repo['private'] else "🌍 Public"
+                repo_list.append(f"📁 {repo['name']} - {visibility}\n   🔗 {repo['html_url']}\n   📝 {repo['description'] or 'No description'}")
             
             if not repo_list:
                 return "No repositories found"
             
-            return f"📚 Your repositories ({len(repo_list)} of {repos.totalCount}):\n\n" + "\n\n".join(repo_list)
+            return f"📚 Your repositories ({len(repo_list)}):\n\n" + "\n\n".join(repo_list)
         
         except Exception as e:
             return f"❌ Failed to list repositories: {str(e)}"
 
     async def get_repo_info(self, repo: str) -> str:
         """Get information about a specific repository"""
-        if not self.github_client:
+        if not self._http:
             return "❌ GitHub authentication required"
         
+        # GitHub repository names are case-insensitive
+        cache_key = repo.lower()
+        cached = self._repo_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await self._single_flight(("info", cache_key),
+                                         lambda: self._fetch_repo_info(repo, cache_key))
+
+    async def _fetch_repo_info(self, repo: str, cache_key: str) -> str:
+        """Fetch and format repository information from GitHub"""
         try:
-            repository = self.github_client.get_repo(repo)
+            response = await self._github_request("GET", f"/repos/{repo}")
+            repository = response.json()
             
-            info = f"""📁 Repository: {repository.full_name}
-📝 Description: {repository.description or 'No description'}
-🌍 Visibility: {'Private' if repository.private else 'Public'}
-⭐ Stars: {repository.stargazers_count}
-🍴 Forks: {repository.forks_count}
-📊 Language: {repository.language or 'Not specified'}
-🔗 URL: {repository.html_url}
-📅 Created: {repository.created_at.strftime('%Y-%m-%d')}
-📅 Updated: {repository.updated_at.strftime('%Y-%m-%d')}
-📏 Size: {repository.size} KB"""
+            # created_at/updated_at are ISO 8601, so the date is the first 10 characters
+            info = self._INFO_TMPL.format_map({
+                **repository,
+                "description": repository['description'] or 'No description',
+                "visibility": 'Private' if repository['private'] else 'Public',
+                "language": repository['language'] or 'Not specified',
+                "created": repository['created_at'][:10],
+                "updated": repository['updated_at'][:10]
+            })
             
+            self._repo_info_cache[cache_key] = info
             return info
         
         except Exception as e:
@@ -365,32 +675,19 @@ class GitHubMCPServer:
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
-                    "result": {
-                        "tools": list(self.tools.values())
-                    }
+                    "result": TOOLS_LIST_RESULT
                 }
             
             elif method == "tools/call":
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
                 
-                result_text = ""
-                
-                if tool_name == "create_repo":
-                    result_text = await self.create_repo(**arguments)
-                elif tool_name == "commit_and_push":
-                    result_text = await self.commit_and_push(**arguments)
-                elif tool_name == "clone_repo":
-                    result_text = await self.clone_repo(**arguments)
-                elif tool_name == "create_issue":
-                    result_text = await self.create_issue(**arguments)
-                elif tool_name == "list_repos":
-                    result_text = await self.list_repos(**arguments)
-                elif tool_name == "get_repo_info":
-                    result_text = await self.get_repo_info(**arguments)
-                else:
+                handler = self._tool_handlers.get(tool_name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {tool_name}")
                 
+                result_text = await handler(**arguments)
+                
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -417,39 +714,166 @@ class GitHubMCPServer:
                 }
             }
 
-    async def run(self):
-        """Main server loop"""
-        while True:
+    async def _dispatch(self, line: bytes):
+        """Handle a single JSON-RPC message and write its response"""
+        try:
             try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                request = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                return
+            
+            response = await self.handle_request(request)
+            self._out_q.put_nowait(orjson.dumps(response))
+        
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+        finally:
+            self._inflight.release()
+
+    async def _wait_writable(self, fd: int):
+        """Wait until the event loop reports fd as writable"""
+        loop = asyncio.get_event_loop()
+        ready = loop.create_future()
+        loop.add_writer(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_writer(fd)
+
+    async def _writer(self):
+        """Write queued responses to stdout, coalescing bursts into one write"""
+        # stdout may share its open file with stdin (a TTY or a socket), which the
+        # stdin reader makes non-blocking, so writes can fail with BlockingIOError.
+        # O_NONBLOCK lives on that shared open file, so setting it here affects
+        # stdin, stderr and anything else using it; it is put back on the way out.
+        # The duplicate fd only keeps this writability watch apart from the stdin
+        # reader's registration with the event loop.
+        fd = None
+        restore_blocking = False
+        try:
+            fd = os.dup(sys.stdout.fileno())
+            # Regular files can't be watched by the event loop, but writes to them never block
+            if not stat.S_ISREG(os.fstat(fd).st_mode) and os.get_blocking(fd):
+                os.set_blocking(fd, False)
+                restore_blocking = True
+            
+            done = False
+            while not done:
+                chunks = [await self._out_q.get()]
+                while len(chunks) < WRITE_BATCH_SIZE and not self._out_q.empty():
+                    chunks.append(self._out_q.get_nowait())
                 
-                if not line:
-                    break
-                    
-                line = line.strip()
-                if not line:
+                # None marks the end of output
+                if chunks[-1] is None:
+                    chunks.pop()
+                    done = True
+                if not chunks:
                     continue
                 
-                try:
-                    request = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+                buf = memoryview(b"\n".join(chunks) + b"\n")
+                while buf:
+                    try:
+                        buf = buf[os.write(fd, buf):]
+                    except BlockingIOError:
+                        await self._wait_writable(fd)
+        
+        except OSError as e:
+            print(f"Error: stdout closed, stopping: {e}", file=sys.stderr)
+        finally:
+            if fd is not None:
+                if restore_blocking:
+                    try:
+                        os.set_blocking(fd, True)
+                    except OSError:
+                        pass
+                os.close(fd)
+
+    async def run(self):
+        """Main server loop"""
+        loop = asyncio.get_event_loop()
+        writer = asyncio.create_task(self._writer())
+        
+        stdin_fd = sys.stdin.fileno()
+        mode = os.fstat(stdin_fd).st_mode
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(stdin_fd)):
+            # Regular files and devices like /dev/null can't be watched by the
+            # event loop, so read them in a worker thread
+            def read_chunk():
+                return loop.run_in_executor(None, os.read, stdin_fd, STDIN_READ_SIZE)
+        else:
+            # The pipe transport sets O_NONBLOCK on the open file stdin shares
+            # with the parent (and possibly stdout), so note the mode to put back
+            stdin_blocking = os.get_blocking(stdin_fd)
+            reader = asyncio.StreamReader()
+            read_transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+            def stop_reading(_):
+                # Closing the transport ends a pending read once output has failed
+                read_transport.close()
+                if stdin_blocking:
+                    os.set_blocking(stdin_fd, True)
+
+            writer.add_done_callback(stop_reading)
+            
+            def read_chunk():
+                return reader.read(STDIN_READ_SIZE)
+        
+        tasks = set()
+        buf = bytearray()
+        eof = False
+        # If output fails there is no point reading more requests
+        while not eof and not writer.done():
+            try:
+                # Read whatever has arrived and split it into messages here,
+                # so a burst of requests costs one read instead of one per line
+                data = await read_chunk()
+                if data:
+                    buf += data
+                    end = buf.rfind(b"\n")
+                    if end < 0:
+                        if len(buf) > STDIN_LINE_LIMIT:
+                            print("Error: message exceeds size limit, discarding", file=sys.stderr)
+                            buf.clear()
+                        continue
+                    lines = buf[:end].split(b"\n")
+                    del buf[:end + 1]
+                else:
+                    eof = True
+                    lines = [buf]
                 
-                response = await self.handle_request(request)
-                print(json.dumps(response), flush=True)
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    
+                    # Each request runs in its own task so slow tool calls don't
+                    # hold up the ones queued behind them
+                    await self._inflight.acquire()
+                    task = asyncio.create_task(self._dispatch(bytes(line)))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
                 
-            except EOFError:
-                break
             except Exception as e:
                 print(f"Error: {e}", file=sys.stderr)
+        
+        if tasks:
+            await asyncio.gather(*tasks)
+        
+        self._out_q.put_nowait(None)
+        await writer
 
 
 async def main():
     server = GitHubMCPServer()
-    await server.run()
+    try:
+        await server.run()
+    finally:
+        await server.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is a faster drop-in event loop; fall back to asyncio's default without it
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())